@@ -26,7 +26,7 @@ from homeassistant.helpers.network import NoURLAvailableError, get_url
 
 from .const import DOMAIN, LOGGER
 from .models import Event, PullPointManagerState, WebHookManagerState
-from .parsers import PARSERS
+from .parsers import PARSERS, extract_topic
 
 # Topics in this list are ignored because we do not want to create
 # entities for them.
@@ -142,25 +142,16 @@ class EventManager:
         for update_callback in self._listeners:
             update_callback()
 
-    async def async_parse_messages(self, messages) -> None:
+    @callback
+    def async_parse_messages(self, messages) -> None:
         """Parse notification message."""
         unique_id = self.unique_id
         assert unique_id is not None
         for msg in messages:
             # Guard against empty message
-            if not msg.Topic:
+            if (topic := extract_topic(msg)) is None:
                 continue
 
-            # Topic may look like the following
-            #
-            # tns1:RuleEngine/CellMotionDetector/Motion//.
-            # tns1:RuleEngine/CellMotionDetector/Motion
-            # tns1:RuleEngine/CellMotionDetector/Motion/
-            #
-            # Our parser expects the topic to be
-            # tns1:RuleEngine/CellMotionDetector/Motion
-            topic = msg.Topic._value_1.rstrip("/.")  # pylint: disable=protected-access
-
             if not (parser := PARSERS.get(topic)):
                 if topic not in UNHANDLED_TOPICS:
                     LOGGER.info(
@@ -172,7 +163,10 @@ class EventManager:
                     UNHANDLED_TOPICS.add(topic)
                 continue
 
-            event = await parser(unique_id, msg)
+            try:
+                event = parser(unique_id, topic, msg)
+            except (AttributeError, KeyError):
+                event = None
 
             if not event:
                 LOGGER.info(
@@ -419,7 +413,7 @@ class PullPointManager:
                 self._name,
                 number_of_events,
             )
-            await event_manager.async_parse_messages(notification_message)
+            event_manager.async_parse_messages(notification_message)
             event_manager.async_callback_listeners()
         else:
             LOGGER.debug("%s: continuous PullMessages: no events", self._name)
@@ -637,7 +631,7 @@ class WebHookManager:
             len(result.NotificationMessage),
         )
         event_manager.async_webhook_working()
-        await event_manager.async_parse_messages(result.NotificationMessage)
+        event_manager.async_parse_messages(result.NotificationMessage)
         event_manager.async_callback_listeners()
 
     async def _async_unsubscribe_webhook(self) -> None:
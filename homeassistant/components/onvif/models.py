@@ -67,7 +67,7 @@ class Capabilities:
     imaging: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a ONVIF event."""
 
@@ -1,9 +1,10 @@
 """ONVIF event parsers."""
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
-import datetime
-from typing import Any
+from collections.abc import Callable, Container
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
 from homeassistant.const import EntityCategory
 from homeassistant.util import dt as dt_util
@@ -11,697 +12,447 @@ from homeassistant.util.decorator import Registry
 
 from .models import Event
 
-PARSERS: Registry[
-    str, Callable[[str, Any], Coroutine[Any, Any, Event | None]]
-] = Registry()
+if TYPE_CHECKING:
+    import datetime
+
+# Parsers raise AttributeError or KeyError for messages missing expected items
+PARSERS: Registry[str, Callable[[str, str, Any], Event]] = Registry()
 
 VIDEO_SOURCE_MAPPING = {
     "vsconf": "VideoSourceToken",
 }
 
+_DIAGNOSTIC: Final = EntityCategory.DIAGNOSTIC
 
-def _normalize_video_source(source: str) -> str:
-    """Normalize video source.
-
-    Some cameras do not set the VideoSourceToken correctly so we get duplicate
-    sensors, so we need to normalize it to the correct value.
-    """
-    return VIDEO_SOURCE_MAPPING.get(source, source)
-
-
-def local_datetime_or_none(value: str) -> datetime.datetime | None:
-    """Convert strings to datetimes, if invalid, return None."""
-    # To handle cameras that return times like '0000-00-00T00:00:00Z' (e.g. hikvision)
-    try:
-        ret = dt_util.parse_datetime(value)
-    except ValueError:
-        return None
-    if ret is not None:
-        return dt_util.as_local(ret)
-    return None
-
-
-@PARSERS.register("tns1:VideoSource/MotionAlarm")
-async def async_parse_motion_alarm(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:VideoSource/MotionAlarm
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Motion Alarm",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:VideoSource/ImageTooBlurry/AnalyticsService")
-@PARSERS.register("tns1:VideoSource/ImageTooBlurry/ImagingService")
-@PARSERS.register("tns1:VideoSource/ImageTooBlurry/RecordingService")
-async def async_parse_image_too_blurry(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:VideoSource/ImageTooBlurry/*
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Image Too Blurry",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:VideoSource/ImageTooDark/AnalyticsService")
-@PARSERS.register("tns1:VideoSource/ImageTooDark/ImagingService")
-@PARSERS.register("tns1:VideoSource/ImageTooDark/RecordingService")
-async def async_parse_image_too_dark(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:VideoSource/ImageTooDark/*
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Image Too Dark",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:VideoSource/ImageTooBright/AnalyticsService")
-@PARSERS.register("tns1:VideoSource/ImageTooBright/ImagingService")
-@PARSERS.register("tns1:VideoSource/ImageTooBright/RecordingService")
-async def async_parse_image_too_bright(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:VideoSource/ImageTooBright/*
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Image Too Bright",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:VideoSource/GlobalSceneChange/AnalyticsService")
-@PARSERS.register("tns1:VideoSource/GlobalSceneChange/ImagingService")
-@PARSERS.register("tns1:VideoSource/GlobalSceneChange/RecordingService")
-async def async_parse_scene_change(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:VideoSource/GlobalSceneChange/*
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Global Scene Change",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:AudioAnalytics/Audio/DetectedSound")
-async def async_parse_detected_sound(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+# xs:boolean allows "1" for true, some cameras capitalize it
+_TRUE_VALUES = frozenset({"true", "True", "1"})
+_ACTIVE_VALUES = frozenset({"active", "Active"})
 
-    Topic: tns1:AudioAnalytics/Audio/DetectedSound
-    """
-    try:
-        audio_source = ""
-        audio_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "AudioSourceConfigurationToken":
-                audio_source = source.Value
-            if source.Name == "AudioAnalyticsConfigurationToken":
-                audio_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
+# Resolve the zeep message paths shared by all parsers in one C call each
+_MESSAGE_PAYLOAD = attrgetter("Message._value_1")
+_SOURCE_ITEMS = attrgetter("Source.SimpleItem")
+_DATA_ITEMS = attrgetter("Data.SimpleItem")
 
-        return Event(
-            f"{uid}_{value_1}_{audio_source}_{audio_analytics}_{rule}",
-            "Detected Sound",
-            "binary_sensor",
-            "sound",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
+# Topics ending in /* are registered for each of these subtopics
+_SERVICE_SUBTOPICS = ("AnalyticsService", "ImagingService", "RecordingService")
 
+_VIDEO_ANALYTICS_ITEMS = (
+    "VideoSourceConfigurationToken",
+    "VideoAnalyticsConfigurationToken",
+    "Rule",
+)
+_AUDIO_ANALYTICS_ITEMS = (
+    "AudioSourceConfigurationToken",
+    "AudioAnalyticsConfigurationToken",
+    "Rule",
+)
 
-@PARSERS.register("tns1:RuleEngine/FieldDetector/ObjectsInside")
-async def async_parse_field_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:RuleEngine/FieldDetector/ObjectsInside
-    """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = _normalize_video_source(source.Value)
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        evt = Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Field Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-        return evt
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RuleEngine/CellMotionDetector/Motion")
-async def async_parse_cell_motion_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:RuleEngine/CellMotionDetector/Motion
-    """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = _normalize_video_source(source.Value)
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Cell Motion Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RuleEngine/MotionRegionDetector/Motion")
-async def async_parse_motion_region_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:RuleEngine/MotionRegionDetector/Motion
-    """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = _normalize_video_source(source.Value)
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Motion Region Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value in ["1", "true"],
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RuleEngine/TamperDetector/Tamper")
-async def async_parse_tamper_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+def _normalize_video_source(source: str) -> str:
+    """Normalize video source.
 
-    Topic: tns1:RuleEngine/TamperDetector/Tamper
+    Some cameras do not set the VideoSourceToken correctly so we get duplicate
+    sensors, so we need to normalize it to the correct value.
     """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = _normalize_video_source(source.Value)
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Tamper Detection",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
+    return VIDEO_SOURCE_MAPPING.get(source, source)
 
 
-@PARSERS.register("tns1:RuleEngine/MyRuleDetector/DogCatDetect")
-async def async_parse_dog_cat_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+def _expand_topic(topic: str) -> tuple[str, ...]:
+    """Return the topics to register a parser for."""
+    if topic.endswith("/*"):
+        return tuple(f"{topic[:-1]}{service}" for service in _SERVICE_SUBTOPICS)
+    return (topic,)
 
-    Topic: tns1:RuleEngine/MyRuleDetector/DogCatDetect
-    """
-    try:
-        video_source = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "Source":
-                video_source = _normalize_video_source(source.Value)
 
-        return Event(
-            f"{uid}_{value_1}_{video_source}",
-            "Pet Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
+def extract_topic(msg: Any) -> str | None:
+    """Return the normalized topic of an event message, None if it has none.
 
+    Topic may look like the following
 
-@PARSERS.register("tns1:RuleEngine/MyRuleDetector/VehicleDetect")
-async def async_parse_vehicle_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+    tns1:RuleEngine/CellMotionDetector/Motion//.
+    tns1:RuleEngine/CellMotionDetector/Motion
+    tns1:RuleEngine/CellMotionDetector/Motion/
 
-    Topic: tns1:RuleEngine/MyRuleDetector/VehicleDetect
+    Parsers are registered for tns1:RuleEngine/CellMotionDetector/Motion
     """
-    try:
-        video_source = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "Source":
-                video_source = _normalize_video_source(source.Value)
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}",
-            "Vehicle Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
+    if not (msg_topic := msg.Topic):
         return None
+    return msg_topic._value_1.rstrip("/.")  # pylint: disable=protected-access
 
 
-@PARSERS.register("tns1:RuleEngine/MyRuleDetector/PeopleDetect")
-async def async_parse_person_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+def _source_items(value_1: Any) -> dict[str, str]:
+    """Return the source items of an event message keyed by name."""
+    return {source.Name: source.Value for source in _SOURCE_ITEMS(value_1)}
 
-    Topic: tns1:RuleEngine/MyRuleDetector/PeopleDetect
-    """
-    try:
-        video_source = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "Source":
-                video_source = _normalize_video_source(source.Value)
 
-        return Event(
-            f"{uid}_{value_1}_{video_source}",
-            "Person Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
+def local_datetime_or_none(value: str) -> datetime.datetime | None:
+    """Convert strings to datetimes, if invalid, return None."""
+    return _local_datetime_or_none(value, dt_util.DEFAULT_TIME_ZONE)
 
 
-@PARSERS.register("tns1:RuleEngine/MyRuleDetector/FaceDetect")
-async def async_parse_face_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+@lru_cache(maxsize=256)
+def _local_datetime_or_none(
+    value: str, time_zone: datetime.tzinfo
+) -> datetime.datetime | None:
+    """Convert strings to local datetimes, if invalid, return None.
 
-    Topic: tns1:RuleEngine/MyRuleDetector/FaceDetect
+    Cameras keep reporting the same reboot, reset and sync times, so results
+    are cached. The default time zone is passed in to be part of the cache key,
+    as the configured time zone may change at runtime.
     """
+    # To handle cameras that return times like '0000-00-00T00:00:00Z' (e.g. hikvision)
     try:
-        video_source = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "Source":
-                video_source = _normalize_video_source(source.Value)
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}",
-            "Face Detection",
-            "binary_sensor",
-            "motion",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
+        ret = dt_util.parse_datetime(value)
+    except ValueError:
         return None
-
-
-@PARSERS.register("tns1:RuleEngine/MyRuleDetector/Visitor")
-async def async_parse_visitor_detector(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:RuleEngine/MyRuleDetector/Visitor
-    """
-    try:
-        video_source = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "Source":
-                video_source = _normalize_video_source(source.Value)
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}",
-            "Visitor Detection",
-            "binary_sensor",
-            "occupancy",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
+    if ret is None:
         return None
+    return dt_util.as_local(ret)
 
 
-@PARSERS.register("tns1:Device/Trigger/DigitalInput")
-async def async_parse_digital_input(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:Device/Trigger/DigitalInput
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Digital Input",
-            "binary_sensor",
-            None,
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-        )
-    except (AttributeError, KeyError):
-        return None
+class _SimpleParserSpec(NamedTuple):
+    """Spec of a parser for events identified by their first source item."""
 
+    topic: str
+    name: str
+    platform: str
+    device_class: str | None
+    truth: Container[str] = _TRUE_VALUES
+    entity_category: EntityCategory | None = None
 
-@PARSERS.register("tns1:Device/Trigger/Relay")
-async def async_parse_relay(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:Device/Trigger/Relay
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Relay Triggered",
-            "binary_sensor",
-            None,
-            None,
-            value_1.Data.SimpleItem[0].Value == "active",
-        )
-    except (AttributeError, KeyError):
-        return None
+class _SourceItemsParserSpec(NamedTuple):
+    """Spec of a parser for events identified by named source items."""
 
+    topic: str
+    name: str
+    platform: str
+    device_class: str | None
+    item_names: tuple[str, ...]
+    normalize: bool
+    truth: Container[str] | None = _TRUE_VALUES
+    entity_category: EntityCategory | None = None
 
-@PARSERS.register("tns1:Device/HardwareFailure/StorageFailure")
-async def async_parse_storage_failure(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:Device/HardwareFailure/StorageFailure
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Storage Failure",
-            "binary_sensor",
-            "problem",
-            None,
-            value_1.Data.SimpleItem[0].Value == "true",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
+class _TimestampParserSpec(NamedTuple):
+    """Spec of a parser for diagnostic timestamp events."""
 
+    topic: str
+    name: str
+    entity_enabled: bool
 
-@PARSERS.register("tns1:Monitoring/ProcessorUsage")
-async def async_parse_processor_usage(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:Monitoring/ProcessorUsage
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        usage = float(value_1.Data.SimpleItem[0].Value)
-        if usage <= 1:
-            usage *= 100
+def _make_simple_parser(spec: _SimpleParserSpec) -> Callable[[str, str, Any], Event]:
+    """Return a parser for events identified by their first source item."""
+    name, platform, device_class = spec.name, spec.platform, spec.device_class
+    truth, entity_category = spec.truth, spec.entity_category
 
+    def parse(uid: str, topic: str, msg) -> Event:
+        """Handle parsing event message."""
+        value_1 = _MESSAGE_PAYLOAD(msg)
+        source = _SOURCE_ITEMS(value_1)[0].Value
         return Event(
-            f"{uid}_{value_1}",
-            "Processor Usage",
-            "sensor",
+            f"{uid}_{topic}_{source}",
+            name,
+            platform,
+            device_class,
             None,
-            "percent",
-            int(usage),
-            EntityCategory.DIAGNOSTIC,
+            _DATA_ITEMS(value_1)[0].Value in truth,
+            entity_category,
         )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:Monitoring/OperatingTime/LastReboot")
-async def async_parse_last_reboot(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:Monitoring/OperatingTime/LastReboot
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        date_time = local_datetime_or_none(value_1.Data.SimpleItem[0].Value)
-        return Event(
-            f"{uid}_{value_1}",
-            "Last Reboot",
-            "sensor",
-            "timestamp",
-            None,
-            date_time,
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
+    return parse
 
 
-@PARSERS.register("tns1:Monitoring/OperatingTime/LastReset")
-async def async_parse_last_reset(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
+def _make_source_items_parser(
+    spec: _SourceItemsParserSpec,
+) -> Callable[[str, str, Any], Event]:
+    """Return a parser for events identified by named source items.
 
-    Topic: tns1:Monitoring/OperatingTime/LastReset
+    When normalize is set, the first item is treated as a video source token.
+    When truth is None, the raw data value is used as the event value.
     """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        date_time = local_datetime_or_none(value_1.Data.SimpleItem[0].Value)
+    name, platform, device_class = spec.name, spec.platform, spec.device_class
+    item_names, normalize = spec.item_names, spec.normalize
+    truth, entity_category = spec.truth, spec.entity_category
+
+    def parse(uid: str, topic: str, msg) -> Event:
+        """Handle parsing event message."""
+        value_1 = _MESSAGE_PAYLOAD(msg)
+        items = _source_items(value_1)
+        values = [items.get(item_name, "") for item_name in item_names]
+        if normalize:
+            values[0] = _normalize_video_source(values[0])
+
+        value = _DATA_ITEMS(value_1)[0].Value
         return Event(
-            f"{uid}_{value_1}",
-            "Last Reset",
-            "sensor",
-            "timestamp",
+            # Items without a value are None, format them like an f-string would
+            "_".join((uid, topic, *map(str, values))),
+            name,
+            platform,
+            device_class,
             None,
-            date_time,
-            EntityCategory.DIAGNOSTIC,
-            entity_enabled=False,
+            value if truth is None else value in truth,
+            entity_category,
         )
-    except (AttributeError, KeyError):
-        return None
 
+    return parse
 
-@PARSERS.register("tns1:Monitoring/Backup/Last")
-async def async_parse_backup_last(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
 
-    Topic: tns1:Monitoring/Backup/Last
-    """
+def _make_timestamp_parser(
+    spec: _TimestampParserSpec,
+) -> Callable[[str, str, Any], Event]:
+    """Return a parser for diagnostic timestamp events."""
+    name, entity_enabled = spec.name, spec.entity_enabled
 
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        date_time = local_datetime_or_none(value_1.Data.SimpleItem[0].Value)
+    def parse(uid: str, topic: str, msg) -> Event:
+        """Handle parsing event message."""
+        value_1 = _MESSAGE_PAYLOAD(msg)
+        date_time = local_datetime_or_none(_DATA_ITEMS(value_1)[0].Value)
         return Event(
-            f"{uid}_{value_1}",
-            "Last Backup",
+            f"{uid}_{topic}",
+            name,
             "sensor",
             "timestamp",
             None,
             date_time,
-            EntityCategory.DIAGNOSTIC,
-            entity_enabled=False,
+            _DIAGNOSTIC,
+            entity_enabled=entity_enabled,
         )
-    except (AttributeError, KeyError):
-        return None
-
 
-@PARSERS.register("tns1:Monitoring/OperatingTime/LastClockSynchronization")
-async def async_parse_last_clock_sync(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:Monitoring/OperatingTime/LastClockSynchronization
-    """
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        date_time = local_datetime_or_none(value_1.Data.SimpleItem[0].Value)
-        return Event(
-            f"{uid}_{value_1}",
-            "Last Clock Synchronization",
-            "sensor",
-            "timestamp",
-            None,
-            date_time,
-            EntityCategory.DIAGNOSTIC,
-            entity_enabled=False,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RecordingConfig/JobState")
-async def async_parse_jobstate(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:RecordingConfig/JobState
-    """
-
-    try:
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        source = value_1.Source.SimpleItem[0].Value
-        return Event(
-            f"{uid}_{value_1}_{source}",
-            "Recording Job State",
-            "binary_sensor",
-            None,
-            None,
-            value_1.Data.SimpleItem[0].Value == "Active",
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RuleEngine/LineDetector/Crossed")
-async def async_parse_linedetector_crossed(uid: str, msg) -> Event | None:
-    """Handle parsing event message.
-
-    Topic: tns1:RuleEngine/LineDetector/Crossed
-    """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = source.Value
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Line Detector Crossed",
-            "sensor",
-            None,
-            None,
-            value_1.Data.SimpleItem[0].Value,
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-@PARSERS.register("tns1:RuleEngine/CountAggregation/Counter")
-async def async_parse_count_aggregation_counter(uid: str, msg) -> Event | None:
+    return parse
+
+
+_SIMPLE_PARSERS: tuple[_SimpleParserSpec, ...] = (
+    _SimpleParserSpec(
+        topic="tns1:VideoSource/MotionAlarm",
+        name="Motion Alarm",
+        platform="binary_sensor",
+        device_class="motion",
+    ),
+    _SimpleParserSpec(
+        topic="tns1:VideoSource/ImageTooBlurry/*",
+        name="Image Too Blurry",
+        platform="binary_sensor",
+        device_class="problem",
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:VideoSource/ImageTooDark/*",
+        name="Image Too Dark",
+        platform="binary_sensor",
+        device_class="problem",
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:VideoSource/ImageTooBright/*",
+        name="Image Too Bright",
+        platform="binary_sensor",
+        device_class="problem",
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:VideoSource/GlobalSceneChange/*",
+        name="Global Scene Change",
+        platform="binary_sensor",
+        device_class="problem",
+    ),
+    _SimpleParserSpec(
+        topic="tns1:Device/Trigger/DigitalInput",
+        name="Digital Input",
+        platform="binary_sensor",
+        device_class=None,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:Device/Trigger/Relay",
+        name="Relay Triggered",
+        platform="binary_sensor",
+        device_class=None,
+        truth=_ACTIVE_VALUES,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:Device/HardwareFailure/StorageFailure",
+        name="Storage Failure",
+        platform="binary_sensor",
+        device_class="problem",
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SimpleParserSpec(
+        topic="tns1:RecordingConfig/JobState",
+        name="Recording Job State",
+        platform="binary_sensor",
+        device_class=None,
+        truth=_ACTIVE_VALUES,
+        entity_category=_DIAGNOSTIC,
+    ),
+)
+
+_SOURCE_ITEMS_PARSERS: tuple[_SourceItemsParserSpec, ...] = (
+    _SourceItemsParserSpec(
+        topic="tns1:AudioAnalytics/Audio/DetectedSound",
+        name="Detected Sound",
+        platform="binary_sensor",
+        device_class="sound",
+        item_names=_AUDIO_ANALYTICS_ITEMS,
+        normalize=False,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/FieldDetector/ObjectsInside",
+        name="Field Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/CellMotionDetector/Motion",
+        name="Cell Motion Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MotionRegionDetector/Motion",
+        name="Motion Region Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/TamperDetector/Tamper",
+        name="Tamper Detection",
+        platform="binary_sensor",
+        device_class="problem",
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=True,
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MyRuleDetector/DogCatDetect",
+        name="Pet Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=("Source",),
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MyRuleDetector/VehicleDetect",
+        name="Vehicle Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=("Source",),
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MyRuleDetector/PeopleDetect",
+        name="Person Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=("Source",),
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MyRuleDetector/FaceDetect",
+        name="Face Detection",
+        platform="binary_sensor",
+        device_class="motion",
+        item_names=("Source",),
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/MyRuleDetector/Visitor",
+        name="Visitor Detection",
+        platform="binary_sensor",
+        device_class="occupancy",
+        item_names=("Source",),
+        normalize=True,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/LineDetector/Crossed",
+        name="Line Detector Crossed",
+        platform="sensor",
+        device_class=None,
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=False,
+        truth=None,
+        entity_category=_DIAGNOSTIC,
+    ),
+    _SourceItemsParserSpec(
+        topic="tns1:RuleEngine/CountAggregation/Counter",
+        name="Count Aggregation Counter",
+        platform="sensor",
+        device_class=None,
+        item_names=_VIDEO_ANALYTICS_ITEMS,
+        normalize=True,
+        truth=None,
+        entity_category=_DIAGNOSTIC,
+    ),
+)
+
+_TIMESTAMP_PARSERS: tuple[_TimestampParserSpec, ...] = (
+    _TimestampParserSpec(
+        topic="tns1:Monitoring/OperatingTime/LastReboot",
+        name="Last Reboot",
+        entity_enabled=True,
+    ),
+    _TimestampParserSpec(
+        topic="tns1:Monitoring/OperatingTime/LastReset",
+        name="Last Reset",
+        entity_enabled=False,
+    ),
+    _TimestampParserSpec(
+        topic="tns1:Monitoring/Backup/Last",
+        name="Last Backup",
+        entity_enabled=False,
+    ),
+    _TimestampParserSpec(
+        topic="tns1:Monitoring/OperatingTime/LastClockSynchronization",
+        name="Last Clock Synchronization",
+        entity_enabled=False,
+    ),
+)
+
+
+def _register_spec_parsers() -> None:
+    """Register a parser for each topic of the spec tables."""
+    spec_tables: tuple[
+        tuple[tuple[Any, ...], Callable[[Any], Callable[[str, str, Any], Event]]], ...
+    ] = (
+        (_SIMPLE_PARSERS, _make_simple_parser),
+        (_SOURCE_ITEMS_PARSERS, _make_source_items_parser),
+        (_TIMESTAMP_PARSERS, _make_timestamp_parser),
+    )
+    for specs, make_parser in spec_tables:
+        for spec in specs:
+            PARSERS.update(dict.fromkeys(_expand_topic(spec.topic), make_parser(spec)))
+
+
+_register_spec_parsers()
+
+
+# Processor usage is the only sensor with a unit and a scaled value, so it
+# keeps a hand-written parser instead of a spec table
+@PARSERS.register("tns1:Monitoring/ProcessorUsage")
+def parse_processor_usage(uid: str, topic: str, msg) -> Event:
     """Handle parsing event message.
 
-    Topic: tns1:RuleEngine/CountAggregation/Counter
+    Topic: tns1:Monitoring/ProcessorUsage
     """
-    try:
-        video_source = ""
-        video_analytics = ""
-        rule = ""
-        value_1 = msg.Message._value_1  # pylint: disable=protected-access
-        for source in value_1.Source.SimpleItem:
-            if source.Name == "VideoSourceConfigurationToken":
-                video_source = _normalize_video_source(source.Value)
-            if source.Name == "VideoAnalyticsConfigurationToken":
-                video_analytics = source.Value
-            if source.Name == "Rule":
-                rule = source.Value
-
-        return Event(
-            f"{uid}_{value_1}_{video_source}_{video_analytics}_{rule}",
-            "Count Aggregation Counter",
-            "sensor",
-            None,
-            None,
-            value_1.Data.SimpleItem[0].Value,
-            EntityCategory.DIAGNOSTIC,
-        )
-    except (AttributeError, KeyError):
-        return None
+    value_1 = _MESSAGE_PAYLOAD(msg)
+    raw_usage: str = _DATA_ITEMS(value_1)[0].Value
+    # Most cameras report a whole percentage, skip the float round trip
+    usage: float = int(raw_usage) if raw_usage.isdigit() else float(raw_usage)
+    if usage <= 1:
+        usage *= 100
+
+    return Event(
+        f"{uid}_{topic}",
+        "Processor Usage",
+        "sensor",
+        None,
+        "percent",
+        int(usage),
+        _DIAGNOSTIC,
+    )
@@ -0,0 +1,468 @@
+"""Test ONVIF event parsers."""
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.components.onvif.const import DOMAIN
+from homeassistant.components.onvif.event import EventManager
+from homeassistant.components.onvif.parsers import PARSERS
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from . import MAC, NAME
+
+from tests.common import MockConfigEntry
+
+SOURCE_ITEMS = {
+    "VideoSourceConfigurationToken": "VideoSourceToken",
+    "VideoAnalyticsConfigurationToken": "VideoAnalyticsToken",
+    "AudioSourceConfigurationToken": "AudioSourceToken",
+    "AudioAnalyticsConfigurationToken": "AudioAnalyticsToken",
+    "Rule": "MyRule",
+    "Source": "VideoSourceToken",
+}
+
+
+def _make_message(
+    topic: str,
+    value: str | None,
+    source_items: dict[str, str | None] | None = None,
+) -> Any:
+    """Return an event message shaped like the zeep notification objects."""
+    if source_items is None:
+        source_items = SOURCE_ITEMS
+    return SimpleNamespace(
+        Topic=SimpleNamespace(_value_1=topic),
+        Message=SimpleNamespace(
+            _value_1=SimpleNamespace(
+                Source=SimpleNamespace(
+                    SimpleItem=[
+                        SimpleNamespace(Name=name, Value=item_value)
+                        for name, item_value in source_items.items()
+                    ]
+                ),
+                Data=SimpleNamespace(
+                    SimpleItem=[SimpleNamespace(Name="State", Value=value)]
+                ),
+            )
+        ),
+    )
+
+
+@pytest.fixture(name="event_manager")
+def mock_event_manager(hass: HomeAssistant) -> EventManager:
+    """Return an event manager for a camera."""
+    config_entry = MockConfigEntry(domain=DOMAIN, unique_id=MAC)
+    return EventManager(hass, MagicMock(), config_entry, NAME)
+
+
+REGISTERED_PARSERS = [
+    ("tns1:VideoSource/MotionAlarm", "Motion Alarm", "binary_sensor", "motion", None),
+    *(
+        (
+            f"tns1:VideoSource/{family}/{service}",
+            name,
+            "binary_sensor",
+            "problem",
+            category,
+        )
+        for family, name, category in (
+            ("ImageTooBlurry", "Image Too Blurry", EntityCategory.DIAGNOSTIC),
+            ("ImageTooDark", "Image Too Dark", EntityCategory.DIAGNOSTIC),
+            ("ImageTooBright", "Image Too Bright", EntityCategory.DIAGNOSTIC),
+            ("GlobalSceneChange", "Global Scene Change", None),
+        )
+        for service in ("AnalyticsService", "ImagingService", "RecordingService")
+    ),
+    (
+        "tns1:AudioAnalytics/Audio/DetectedSound",
+        "Detected Sound",
+        "binary_sensor",
+        "sound",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/FieldDetector/ObjectsInside",
+        "Field Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/CellMotionDetector/Motion",
+        "Cell Motion Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/MotionRegionDetector/Motion",
+        "Motion Region Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/TamperDetector/Tamper",
+        "Tamper Detection",
+        "binary_sensor",
+        "problem",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:RuleEngine/MyRuleDetector/DogCatDetect",
+        "Pet Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/MyRuleDetector/VehicleDetect",
+        "Vehicle Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/MyRuleDetector/PeopleDetect",
+        "Person Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/MyRuleDetector/FaceDetect",
+        "Face Detection",
+        "binary_sensor",
+        "motion",
+        None,
+    ),
+    (
+        "tns1:RuleEngine/MyRuleDetector/Visitor",
+        "Visitor Detection",
+        "binary_sensor",
+        "occupancy",
+        None,
+    ),
+    ("tns1:Device/Trigger/DigitalInput", "Digital Input", "binary_sensor", None, None),
+    ("tns1:Device/Trigger/Relay", "Relay Triggered", "binary_sensor", None, None),
+    (
+        "tns1:Device/HardwareFailure/StorageFailure",
+        "Storage Failure",
+        "binary_sensor",
+        "problem",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:Monitoring/ProcessorUsage",
+        "Processor Usage",
+        "sensor",
+        None,
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:Monitoring/OperatingTime/LastReboot",
+        "Last Reboot",
+        "sensor",
+        "timestamp",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:Monitoring/OperatingTime/LastReset",
+        "Last Reset",
+        "sensor",
+        "timestamp",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:Monitoring/Backup/Last",
+        "Last Backup",
+        "sensor",
+        "timestamp",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:Monitoring/OperatingTime/LastClockSynchronization",
+        "Last Clock Synchronization",
+        "sensor",
+        "timestamp",
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:RecordingConfig/JobState",
+        "Recording Job State",
+        "binary_sensor",
+        None,
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:RuleEngine/LineDetector/Crossed",
+        "Line Detector Crossed",
+        "sensor",
+        None,
+        EntityCategory.DIAGNOSTIC,
+    ),
+    (
+        "tns1:RuleEngine/CountAggregation/Counter",
+        "Count Aggregation Counter",
+        "sensor",
+        None,
+        EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+
+def test_registered_topics() -> None:
+    """Test a parser is registered for each supported topic."""
+    assert set(PARSERS) == {topic for topic, *_ in REGISTERED_PARSERS}
+
+
+@pytest.mark.parametrize(
+    ("topic", "name", "platform", "device_class", "entity_category"),
+    REGISTERED_PARSERS,
+)
+def test_registered_parser_descriptions(
+    topic: str,
+    name: str,
+    platform: str,
+    device_class: str | None,
+    entity_category: EntityCategory | None,
+) -> None:
+    """Test each registered parser describes its entity as before."""
+    event = PARSERS[topic](MAC, topic, _make_message(topic, "1"))
+
+    assert event.name == name
+    assert event.platform == platform
+    assert event.device_class == device_class
+    assert event.entity_category == entity_category
+
+
+@pytest.mark.parametrize(
+    ("topic", "entity_enabled"),
+    [
+        ("tns1:Monitoring/OperatingTime/LastReboot", True),
+        ("tns1:Monitoring/OperatingTime/LastReset", False),
+        ("tns1:Monitoring/Backup/Last", False),
+        ("tns1:Monitoring/OperatingTime/LastClockSynchronization", False),
+    ],
+)
+def test_timestamp_parser_entity_enabled(topic: str, entity_enabled: bool) -> None:
+    """Test only the last reboot timestamp is enabled by default."""
+    event = PARSERS[topic](MAC, topic, _make_message(topic, "2023-01-01T00:00:00Z"))
+
+    assert event.entity_enabled is entity_enabled
+
+
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "tns1:VideoSource/MotionAlarm",
+        "tns1:RuleEngine/CellMotionDetector/Motion",
+    ],
+)
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("true", True),
+        ("True", True),
+        ("1", True),
+        ("false", False),
+        ("False", False),
+        ("0", False),
+    ],
+)
+def test_boolean_values(topic: str, value: str, expected: bool) -> None:
+    """Test xs:boolean values of binary sensor events."""
+    event = PARSERS[topic](MAC, topic, _make_message(topic, value))
+
+    assert event.value is expected
+
+
+@pytest.mark.parametrize(
+    "topic",
+    ["tns1:Device/Trigger/Relay", "tns1:RecordingConfig/JobState"],
+)
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("active", True),
+        ("Active", True),
+        ("inactive", False),
+        ("Idle", False),
+        ("true", False),
+    ],
+)
+def test_active_values(topic: str, value: str, expected: bool) -> None:
+    """Test active state values of relay and recording job events."""
+    event = PARSERS[topic](MAC, topic, _make_message(topic, value))
+
+    assert event.value is expected
+
+
+@pytest.mark.parametrize(
+    ("topic", "source_items", "uid"),
+    [
+        (
+            "tns1:VideoSource/MotionAlarm",
+            {"Source": "VideoSourceToken"},
+            f"{MAC}_tns1:VideoSource/MotionAlarm_VideoSourceToken",
+        ),
+        (
+            "tns1:RuleEngine/CellMotionDetector/Motion",
+            {
+                "VideoSourceConfigurationToken": "vsconf",
+                "VideoAnalyticsConfigurationToken": "VideoAnalyticsToken",
+                "Rule": "MyRule",
+            },
+            f"{MAC}_tns1:RuleEngine/CellMotionDetector/Motion"
+            "_VideoSourceToken_VideoAnalyticsToken_MyRule",
+        ),
+        (
+            "tns1:RuleEngine/MyRuleDetector/PeopleDetect",
+            {"Source": "VideoSourceToken"},
+            f"{MAC}_tns1:RuleEngine/MyRuleDetector/PeopleDetect_VideoSourceToken",
+        ),
+        (
+            "tns1:AudioAnalytics/Audio/DetectedSound",
+            {
+                "AudioSourceConfigurationToken": "AudioSourceToken",
+                "AudioAnalyticsConfigurationToken": "AudioAnalyticsToken",
+                "Rule": "MyRule",
+            },
+            f"{MAC}_tns1:AudioAnalytics/Audio/DetectedSound"
+            "_AudioSourceToken_AudioAnalyticsToken_MyRule",
+        ),
+        (
+            "tns1:Monitoring/OperatingTime/LastReboot",
+            {},
+            f"{MAC}_tns1:Monitoring/OperatingTime/LastReboot",
+        ),
+        (
+            "tns1:Monitoring/ProcessorUsage",
+            {},
+            f"{MAC}_tns1:Monitoring/ProcessorUsage",
+        ),
+    ],
+)
+def test_event_uid(topic: str, source_items: dict[str, str], uid: str) -> None:
+    """Test event uids are built from the topic and the source items."""
+    event = PARSERS[topic](MAC, topic, _make_message(topic, "1", source_items))
+
+    assert event.uid == uid
+
+
+async def test_event_manager_source_item_without_value(
+    event_manager: EventManager,
+) -> None:
+    """Test a source item without a value does not stop parsing the batch."""
+    event_manager.async_parse_messages(
+        [
+            _make_message(
+                "tns1:RuleEngine/CellMotionDetector/Motion",
+                "true",
+                {
+                    "VideoSourceConfigurationToken": None,
+                    "VideoAnalyticsConfigurationToken": "VideoAnalyticsToken",
+                    "Rule": "MyRule",
+                },
+            ),
+            _make_message(
+                "tns1:VideoSource/MotionAlarm", "true", {"Source": "VideoSourceToken"}
+            ),
+        ]
+    )
+
+    assert event_manager.get_uids_by_platform("binary_sensor") == {
+        f"{MAC}_tns1:RuleEngine/CellMotionDetector/Motion"
+        "_None_VideoAnalyticsToken_MyRule",
+        f"{MAC}_tns1:VideoSource/MotionAlarm_VideoSourceToken",
+    }
+
+
+async def test_event_manager_normalizes_topic(event_manager: EventManager) -> None:
+    """Test the event manager parses a message with a trailing topic separator."""
+    event_manager.async_parse_messages(
+        [
+            _make_message(
+                "tns1:VideoSource/MotionAlarm//.",
+                "true",
+                {"Source": "VideoSourceToken"},
+            )
+        ]
+    )
+
+    uid = f"{MAC}_tns1:VideoSource/MotionAlarm_VideoSourceToken"
+    assert event_manager.get_uids_by_platform("binary_sensor") == {uid}
+    event = event_manager.get_uid(uid)
+    assert event is not None
+    assert event.value is True
+
+
+@pytest.mark.parametrize(
+    ("values", "usages"),
+    [
+        (("0.5", "1"), (50, 100)),
+        (("42", "0.5", "1"), (42, 50, 100)),
+        (("100", "2.5"), (100, 2)),
+    ],
+)
+def test_processor_usage(values: tuple[str, ...], usages: tuple[int, ...]) -> None:
+    """Test each processor usage reading is scaled to a percentage on its own."""
+    topic = "tns1:Monitoring/ProcessorUsage"
+    parser = PARSERS[topic]
+
+    assert (
+        tuple(
+            parser(MAC, topic, _make_message(topic, value, {})).value
+            for value in values
+        )
+        == usages
+    )
+
+
+@pytest.mark.parametrize(("value", "usage"), [("42", 42), ("0.75", 75)])
+async def test_event_manager_processor_usage(
+    event_manager: EventManager, value: str, usage: int
+) -> None:
+    """Test the event manager parses processor usage readings."""
+    topic = "tns1:Monitoring/ProcessorUsage"
+    event_manager.async_parse_messages([_make_message(topic, value, {})])
+
+    event = event_manager.get_uid(f"{MAC}_{topic}")
+    assert event is not None
+    assert event.value == usage
+
+
+async def test_event_manager_processor_usage_missing(
+    event_manager: EventManager, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a processor usage message without a value is logged as unparsable."""
+    topic = "tns1:Monitoring/ProcessorUsage"
+    event_manager.async_parse_messages([_make_message(topic, None, {})])
+
+    assert event_manager.get_uid(f"{MAC}_{topic}") is None
+    assert event_manager.get_uids_by_platform("sensor") == set()
+    assert f"{NAME}: Unable to parse event from {MAC}" in caplog.text
+
+
+async def test_timestamp_follows_time_zone(hass: HomeAssistant) -> None:
+    """Test cached timestamps are converted again after a time zone change."""
+    topic = "tns1:Monitoring/OperatingTime/LastReboot"
+    msg = _make_message(topic, "2023-01-01T12:00:00Z", {})
+    last_reboot = datetime(2023, 1, 1, 12, tzinfo=UTC)
+
+    event = PARSERS[topic](MAC, topic, msg)
+    assert event.value == last_reboot
+    assert event.value.tzinfo == dt_util.DEFAULT_TIME_ZONE
+
+    time_zone = dt_util.get_time_zone("Europe/Amsterdam")
+    dt_util.set_default_time_zone(time_zone)
+
+    event = PARSERS[topic](MAC, topic, msg)
+    assert event.value == last_reboot
+    assert event.value.tzinfo == time_zone
+    assert event.value.hour == 13
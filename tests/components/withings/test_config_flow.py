@@ -1,10 +1,14 @@
 """Tests for config flow."""
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import pytest
+from yarl import URL
+
 from homeassistant.components.withings.const import CONF_USE_WEBHOOK, DOMAIN
 from homeassistant.config_entries import SOURCE_REAUTH, SOURCE_USER
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResult, FlowResultType
 from homeassistant.helpers import config_entry_oauth2_flow
 
 from . import setup_integration
@@ -14,52 +18,84 @@ from tests.common import MockConfigEntry
 from tests.test_util.aiohttp import AiohttpClientMocker
 from tests.typing import ClientSessionGenerator
 
+pytestmark = pytest.mark.usefixtures("disable_webhook_delay")
 
-async def test_full_flow(
+REDIRECT_URL = "https://example.com/auth/external/callback"
+AUTHORIZE_URL_PREFIX = (
+    "https://account.withings.com/oauth2_user/authorize2?"
+    f"response_type=code&client_id={CLIENT_ID}&"
+    f"redirect_uri={REDIRECT_URL}&state="
+)
+AUTHORIZE_URL_SUFFIX = "&scope=user.info,user.metrics,user.activity,user.sleepevents"
+
+
+@pytest.fixture(name="integrated_entry")
+async def setup_integrated_entry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    withings: AsyncMock,
+) -> MockConfigEntry:
+    """Set up the integration with an existing Withings profile."""
+    await setup_integration(hass, config_entry)
+    return config_entry
+
+
+def _token_response(userid: int) -> dict[str, Any]:
+    """Return the OAuth token response for a Withings user."""
+    return {
+        "body": {
+            "refresh_token": "mock-refresh-token",
+            "access_token": "mock-access-token",
+            "type": "Bearer",
+            "expires_in": 60,
+            "userid": userid,
+        },
+    }
+
+
+async def _async_run_oauth_dance(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
-    current_request_with_host: None,
     aioclient_mock: AiohttpClientMocker,
+    result: FlowResult,
+    userid: int,
 ) -> None:
-    """Check full flow."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
+    """Follow the external OAuth step and mock the token for a Withings user."""
     state = config_entry_oauth2_flow._encode_jwt(
         hass,
         {
             "flow_id": result["flow_id"],
-            "redirect_uri": "https://example.com/auth/external/callback",
+            "redirect_uri": REDIRECT_URL,
         },
     )
-
     assert result["type"] == FlowResultType.EXTERNAL_STEP
-    assert result["url"] == (
-        "https://account.withings.com/oauth2_user/authorize2?"
-        f"response_type=code&client_id={CLIENT_ID}&"
-        "redirect_uri=https://example.com/auth/external/callback&"
-        f"state={state}"
-        "&scope=user.info,user.metrics,user.activity,user.sleepevents"
-    )
+    assert result["url"] == f"{AUTHORIZE_URL_PREFIX}{state}{AUTHORIZE_URL_SUFFIX}"
 
     client = await hass_client_no_auth()
-    resp = await client.get(f"/auth/external/callback?code=abcd&state={state}")
+    resp = await client.get(
+        URL("/auth/external/callback").with_query({"code": "abcd", "state": state})
+    )
     assert resp.status == 200
     assert resp.headers["content-type"] == "text/html; charset=utf-8"
 
     aioclient_mock.clear_requests()
     aioclient_mock.post(
         "https://wbsapi.withings.net/v2/oauth2",
-        json={
-            "body": {
-                "refresh_token": "mock-refresh-token",
-                "access_token": "mock-access-token",
-                "type": "Bearer",
-                "expires_in": 60,
-                "userid": 600,
-            },
-        },
+        json=_token_response(userid),
+    )
+
+
+async def test_full_flow(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    current_request_with_host: None,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Check full flow."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
     )
+    await _async_run_oauth_dance(hass, hass_client_no_auth, aioclient_mock, result, 600)
     with patch(
         "homeassistant.components.withings.async_setup_entry", return_value=True
     ) as mock_setup:
@@ -77,199 +113,64 @@ async def test_full_flow(
     assert result["result"].data["token"]["refresh_token"] == "mock-refresh-token"
 
 
-async def test_config_non_unique_profile(
-    hass: HomeAssistant,
-    hass_client_no_auth: ClientSessionGenerator,
-    current_request_with_host: None,
-    withings: AsyncMock,
-    config_entry: MockConfigEntry,
-    disable_webhook_delay,
-    aioclient_mock: AiohttpClientMocker,
-) -> None:
-    """Test setup a non-unique profile."""
-    await setup_integration(hass, config_entry)
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-    state = config_entry_oauth2_flow._encode_jwt(
-        hass,
-        {
-            "flow_id": result["flow_id"],
-            "redirect_uri": "https://example.com/auth/external/callback",
-        },
-    )
-
-    assert result["type"] == FlowResultType.EXTERNAL_STEP
-    assert result["url"] == (
-        "https://account.withings.com/oauth2_user/authorize2?"
-        f"response_type=code&client_id={CLIENT_ID}&"
-        "redirect_uri=https://example.com/auth/external/callback&"
-        f"state={state}"
-        "&scope=user.info,user.metrics,user.activity,user.sleepevents"
-    )
-
-    client = await hass_client_no_auth()
-    resp = await client.get(f"/auth/external/callback?code=abcd&state={state}")
-    assert resp.status == 200
-    assert resp.headers["content-type"] == "text/html; charset=utf-8"
-
-    aioclient_mock.clear_requests()
-    aioclient_mock.post(
-        "https://wbsapi.withings.net/v2/oauth2",
-        json={
-            "body": {
-                "refresh_token": "mock-refresh-token",
-                "access_token": "mock-access-token",
-                "type": "Bearer",
-                "expires_in": 60,
-                "userid": USER_ID,
-            },
-        },
-    )
-    result = await hass.config_entries.flow.async_configure(result["flow_id"])
-    assert result["type"] == FlowResultType.ABORT
-    assert result["reason"] == "already_configured"
-
-
-async def test_config_reauth_profile(
+@pytest.mark.parametrize(
+    ("source", "userid", "reason"),
+    [
+        (SOURCE_USER, USER_ID, "already_configured"),
+        (SOURCE_REAUTH, USER_ID, "reauth_successful"),
+        (SOURCE_REAUTH, 12346, "wrong_account"),
+    ],
+    ids=["non_unique_profile", "reauth_profile", "reauth_wrong_account"],
+)
+async def test_config_abort(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
     aioclient_mock: AiohttpClientMocker,
-    config_entry: MockConfigEntry,
-    withings: AsyncMock,
-    disable_webhook_delay,
     current_request_with_host,
+    integrated_entry: MockConfigEntry,
+    source: str,
+    userid: int,
+    reason: str,
 ) -> None:
-    """Test reauth an existing profile reauthenticates the config entry."""
-    await setup_integration(hass, config_entry)
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={
-            "source": SOURCE_REAUTH,
-            "entry_id": config_entry.entry_id,
-        },
-        data=config_entry.data,
-    )
-    assert result["type"] == "form"
-    assert result["step_id"] == "reauth_confirm"
-
-    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
-    state = config_entry_oauth2_flow._encode_jwt(
-        hass,
-        {
-            "flow_id": result["flow_id"],
-            "redirect_uri": "https://example.com/auth/external/callback",
-        },
-    )
-    assert result["url"] == (
-        "https://account.withings.com/oauth2_user/authorize2?"
-        f"response_type=code&client_id={CLIENT_ID}&"
-        "redirect_uri=https://example.com/auth/external/callback&"
-        f"state={state}"
-        "&scope=user.info,user.metrics,user.activity,user.sleepevents"
-    )
-    client = await hass_client_no_auth()
-    resp = await client.get(f"/auth/external/callback?code=abcd&state={state}")
-    assert resp.status == 200
-    assert resp.headers["content-type"] == "text/html; charset=utf-8"
-
-    aioclient_mock.clear_requests()
-    aioclient_mock.post(
-        "https://wbsapi.withings.net/v2/oauth2",
-        json={
-            "body": {
-                "refresh_token": "mock-refresh-token",
-                "access_token": "mock-access-token",
-                "type": "Bearer",
-                "expires_in": 60,
-                "userid": USER_ID,
+    """Test flows for an existing profile abort after authenticating."""
+    if source == SOURCE_REAUTH:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={
+                "source": SOURCE_REAUTH,
+                "entry_id": integrated_entry.entry_id,
             },
-        },
-    )
-
-    result = await hass.config_entries.flow.async_configure(result["flow_id"])
-    assert result
-    assert result["type"] == FlowResultType.ABORT
-    assert result["reason"] == "reauth_successful"
-
+            data=integrated_entry.data,
+        )
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "reauth_confirm"
 
-async def test_config_reauth_wrong_account(
-    hass: HomeAssistant,
-    hass_client_no_auth: ClientSessionGenerator,
-    aioclient_mock: AiohttpClientMocker,
-    config_entry: MockConfigEntry,
-    withings: AsyncMock,
-    disable_webhook_delay,
-    current_request_with_host,
-) -> None:
-    """Test reauth with wrong account."""
-    await setup_integration(hass, config_entry)
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={
-            "source": SOURCE_REAUTH,
-            "entry_id": config_entry.entry_id,
-        },
-        data=config_entry.data,
-    )
-    assert result["type"] == "form"
-    assert result["step_id"] == "reauth_confirm"
-
-    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
-    state = config_entry_oauth2_flow._encode_jwt(
-        hass,
-        {
-            "flow_id": result["flow_id"],
-            "redirect_uri": "https://example.com/auth/external/callback",
-        },
-    )
-    assert result["url"] == (
-        "https://account.withings.com/oauth2_user/authorize2?"
-        f"response_type=code&client_id={CLIENT_ID}&"
-        "redirect_uri=https://example.com/auth/external/callback&"
-        f"state={state}"
-        "&scope=user.info,user.metrics,user.activity,user.sleepevents"
-    )
-    client = await hass_client_no_auth()
-    resp = await client.get(f"/auth/external/callback?code=abcd&state={state}")
-    assert resp.status == 200
-    assert resp.headers["content-type"] == "text/html; charset=utf-8"
+        flow_id = result["flow_id"]
+        result = await hass.config_entries.flow.async_configure(flow_id, {})
+        assert result["flow_id"] == flow_id
+    else:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": source}
+        )
 
-    aioclient_mock.clear_requests()
-    aioclient_mock.post(
-        "https://wbsapi.withings.net/v2/oauth2",
-        json={
-            "body": {
-                "refresh_token": "mock-refresh-token",
-                "access_token": "mock-access-token",
-                "type": "Bearer",
-                "expires_in": 60,
-                "userid": 12346,
-            },
-        },
+    await _async_run_oauth_dance(
+        hass, hass_client_no_auth, aioclient_mock, result, userid
     )
 
     result = await hass.config_entries.flow.async_configure(result["flow_id"])
-    assert result
     assert result["type"] == FlowResultType.ABORT
-    assert result["reason"] == "wrong_account"
+    assert result["reason"] == reason
 
 
 async def test_options_flow(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
     aioclient_mock: AiohttpClientMocker,
-    config_entry: MockConfigEntry,
-    withings: AsyncMock,
-    disable_webhook_delay,
     current_request_with_host,
+    integrated_entry: MockConfigEntry,
 ) -> None:
     """Test options flow."""
-    await setup_integration(hass, config_entry)
-
-    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_init(integrated_entry.entry_id)
     await hass.async_block_till_done()
 
     assert result["type"] == FlowResultType.FORM